@@ -0,0 +1,171 @@
+import time
+from datetime import timedelta
+
+import jwt
+import pytest
+from fastapi.testclient import TestClient
+from main import ALGORITHM, SECRET_KEY, _decode_jwt, app, create_access_token
+
+FIXED_NOW = 1700000000.0
+
+client = TestClient(app)
+
+
+def register(email, password="SecurePass123!"):
+    """Register a user and return the token response"""
+    response = client.post(
+        "/auth/register",
+        json={
+            "email": email,
+            "password": password,
+            "first_name": "Test",
+            "last_name": "User",
+        },
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_access_token_matches_pyjwt(monkeypatch):
+    """Test that hand-signed tokens are byte-identical to jwt.encode"""
+    monkeypatch.setattr(time, "time", lambda: FIXED_NOW)
+    token = create_access_token({"sub": "user-1"}, timedelta(minutes=30))
+    expected = jwt.encode(
+        {"sub": "user-1", "exp": int(FIXED_NOW) + 1800},
+        SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+    assert token == expected
+
+
+def test_access_token_default_expiry(monkeypatch):
+    """Test that tokens default to a 15 minute lifetime"""
+    monkeypatch.setattr(time, "time", lambda: FIXED_NOW)
+    payload = jwt.decode(
+        create_access_token({"sub": "user-1"}),
+        SECRET_KEY,
+        algorithms=[ALGORITHM],
+        options={"verify_exp": False},
+    )
+    assert payload["exp"] == int(FIXED_NOW) + 900
+
+
+def test_decode_accepts_pyjwt_token():
+    """Test that tokens signed by PyJWT verify"""
+    token = jwt.encode(
+        {"sub": "user-1", "exp": int(time.time()) + 60},
+        SECRET_KEY,
+        algorithm=ALGORITHM,
+    )
+    assert _decode_jwt(token)["sub"] == "user-1"
+
+
+def test_decode_rejects_bad_signature():
+    """Test that a token signed with another key is rejected"""
+    token = jwt.encode({"sub": "user-1"}, "some-other-key", algorithm=ALGORITHM)
+    with pytest.raises(jwt.InvalidSignatureError):
+        _decode_jwt(token)
+
+
+def test_decode_rejects_tampered_payload():
+    """Test that swapping the payload invalidates the signature"""
+    header, _, signature = create_access_token({"sub": "user-1"}).split(".")
+    _, payload, _ = create_access_token({"sub": "user-2"}).split(".")
+    with pytest.raises(jwt.InvalidSignatureError):
+        _decode_jwt(f"{header}.{payload}.{signature}")
+
+
+@pytest.mark.parametrize("algorithm", ["HS512", "none"])
+def test_decode_rejects_wrong_algorithm(algorithm):
+    """Test that only HS256 tokens are accepted"""
+    key = None if algorithm == "none" else SECRET_KEY
+    token = jwt.encode({"sub": "user-1"}, key, algorithm=algorithm)
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        _decode_jwt(token)
+
+
+def test_decode_rejects_expired_token():
+    """Test that an expired token is rejected"""
+    token = create_access_token({"sub": "user-1"}, timedelta(seconds=-10))
+    with pytest.raises(jwt.ExpiredSignatureError):
+        _decode_jwt(token)
+
+
+@pytest.mark.parametrize(
+    "token", ["", "not-a-jwt", "a.b", "a.b.c", "a.b.c.d", "héader.payload.sig"]
+)
+def test_decode_rejects_malformed_token(token):
+    """Test that malformed tokens raise a PyJWT error"""
+    with pytest.raises(jwt.PyJWTError):
+        _decode_jwt(token)
+
+
+def test_profile_etag_headers():
+    """Test that the profile response carries its cache validators"""
+    token = register("etag-headers@example.com")["access_token"]
+    response = client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert response.headers["etag"]
+    assert response.headers["vary"] == "Authorization"
+    assert response.headers["cache-control"] == "private, no-cache"
+
+
+def test_profile_not_modified():
+    """Test that a matching If-None-Match returns an empty 304"""
+    token = register("etag-304@example.com")["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    etag = client.get("/auth/me", headers=headers).headers["etag"]
+
+    response = client.get("/auth/me", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_profile_update_changes_etag():
+    """Test that updating the profile invalidates the old ETag"""
+    token = register("etag-update@example.com")["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    etag = client.get("/auth/me", headers=headers).headers["etag"]
+
+    response = client.put("/auth/me", json={"first_name": "Renamed"}, headers=headers)
+    assert response.status_code == 200
+
+    response = client.get("/auth/me", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["first_name"] == "Renamed"
+
+
+def test_login_email_is_case_and_whitespace_insensitive():
+    """Test that login matches the registered email in any case"""
+    register("John.Case@Example.com")
+    response = client.post(
+        "/auth/login",
+        json={"email": " john.case@EXAMPLE.com ", "password": "SecurePass123!"},
+    )
+    assert response.status_code == 200
+    assert response.json()["user"]["email"] == "John.Case@example.com"
+
+
+def test_register_duplicate_email_in_other_case():
+    """Test that an email differing only in case is a duplicate"""
+    register("dup.case@example.com")
+    response = client.post(
+        "/auth/register",
+        json={
+            "email": "DUP.Case@Example.COM",
+            "password": "SecurePass123!",
+            "first_name": "Test",
+            "last_name": "User",
+        },
+    )
+    assert response.status_code == 400
+
+
+def test_login_without_at_sign():
+    """Test that a login email without @ is rejected as unauthorized"""
+    response = client.post(
+        "/auth/login", json={"email": "not-an-email", "password": "SecurePass123!"}
+    )
+    assert response.status_code == 401
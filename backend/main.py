@@ -1,14 +1,35 @@
+import asyncio
+import base64
+import binascii
+import hashlib
+import hmac
 import os
-import uuid
+import secrets
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Optional
+from types import MappingProxyType
+from typing import List, Literal, Optional
 
 import httpx
 import jwt
-from fastapi import Depends, FastAPI, HTTPException, Path, Query
+import orjson
+from cachetools import TTLCache
+from fastapi import (
+    Body,
+    Depends,
+    FastAPI,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 tags_metadata = [
     {
@@ -33,6 +54,22 @@ tags_metadata = [
     },
 ]
 
+# Swagger UI, ReDoc and the OpenAPI schema are not served in production
+DOCS_ENABLED = os.getenv("ENVIRONMENT", "development") != "production"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one pooled HTTP client to the auth service across requests"""
+    app.state.auth_client = httpx.AsyncClient(
+        base_url=AUTH_SERVICE_URL,
+        timeout=2.0,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
+    yield
+    await app.state.auth_client.aclose()
+
+
 app = FastAPI(
     title="Luxe Jewelry Store API",
     description="""
@@ -56,6 +93,11 @@ Most endpoints support optional JWT Bearer authentication. Authenticated users g
         "name": "MIT",
     },
     openapi_tags=tags_metadata,
+    docs_url="/docs" if DOCS_ENABLED else None,
+    redoc_url="/redoc" if DOCS_ENABLED else None,
+    openapi_url="/openapi.json" if DOCS_ENABLED else None,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Enable CORS for React frontend
@@ -63,9 +105,14 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],  # React dev server
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists let Starlette answer preflights without echoing headers
+    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_headers=["Authorization", "Content-Type"],
+    # Let browsers reuse a preflight result for a day
+    max_age=86400,
 )
+# Compress the larger JSON payloads (catalog, carts, stats); small ones skip it
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
 
 # Auth service configuration
 AUTH_SERVICE_URL = os.getenv("AUTH_SERVICE_URL", "http://localhost:8001")
@@ -74,19 +121,31 @@ ALGORITHM = "HS256"
 
 security = HTTPBearer(auto_error=False)
 
+# HS256 key schedule, derived once; each verification works on a copy
+_hmac_prototype = hmac.new(JWT_SECRET_KEY.encode("utf-8"), digestmod=hashlib.sha256)
+
+# Per-token and per-user caches in front of JWT decoding and the auth-service
+# round-trip. Everything runs on the event loop, so no lock is needed. The
+# user lookup awaits between its cache miss and write, but a duplicate lookup
+# is harmless and concurrent ones are coalesced below.
+_token_cache = TTLCache(maxsize=10000, ttl=60)
+_user_info_cache = TTLCache(maxsize=10000, ttl=60)
+# user_id -> task for an auth-service lookup that is already in flight
+_user_info_inflight = {}
+
 
 # Data Models
 class Product(BaseModel):
-    id: int = Field(..., example=1, description="Unique product identifier")
-    name: str = Field(..., example="Diamond Engagement Ring", description="Product name")
-    price: float = Field(..., example=2999.00, description="Price in USD")
-    image: str = Field(..., example="https://images.unsplash.com/photo-1605100804763-247f67b3557e", description="Product image URL")
-    description: str = Field(..., example="Elegant 1.5 carat diamond ring in 18k white gold", description="Product description")
-    category: str = Field(default="jewelry", example="rings", description="Product category")
-    in_stock: bool = Field(default=True, example=True, description="Stock availability")
-
-    class Config:
-        json_schema_extra = {
+    id: int = Field(..., description="Unique product identifier")
+    name: str = Field(..., description="Product name")
+    price: float = Field(..., description="Price in USD")
+    image: str = Field(..., description="Product image URL")
+    description: str = Field(..., description="Product description")
+    category: str = Field(default="jewelry", description="Product category")
+    in_stock: bool = Field(default=True, description="Stock availability")
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": 1,
                 "name": "Diamond Engagement Ring",
@@ -97,42 +156,97 @@ class Product(BaseModel):
                 "in_stock": True
             }
         }
+    )
 
 
 class CartItem(BaseModel):
-    id: str = Field(..., example="550e8400-e29b-41d4-a716-446655440000", description="Cart item UUID")
-    product_id: int = Field(..., example=1, description="Product ID reference")
-    quantity: int = Field(..., example=2, description="Quantity in cart")
+    id: str = Field(..., description="Cart item ID (16 hex characters)")
+    product_id: int = Field(..., description="Product ID reference")
+    quantity: int = Field(..., description="Quantity in cart")
     added_at: datetime = Field(..., description="Timestamp when item was added")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
-                "id": "550e8400-e29b-41d4-a716-446655440000",
+                "id": "9f86d081884c7d65",
                 "product_id": 1,
                 "quantity": 2,
                 "added_at": "2024-01-15T10:30:00"
             }
         }
+    )
+
+
+class CartOperation(BaseModel):
+    op: Literal["add", "remove", "update"] = Field(..., description="Operation")
+    product_id: Optional[int] = Field(None, description="Product ID (add)")
+    item_id: Optional[str] = Field(None, description="Cart item ID (remove, update)")
+    quantity: Optional[int] = Field(
+        None, ge=0, description="Quantity to add (default 1) or set (update)"
+    )
+
+    @model_validator(mode="after")
+    def check_target(self):
+        if self.op == "add":
+            if self.product_id is None:
+                raise ValueError("add requires product_id")
+            if self.quantity is None:
+                self.quantity = 1
+            elif self.quantity < 1:
+                raise ValueError("add requires a quantity of at least 1")
+        elif self.item_id is None:
+            raise ValueError(f"{self.op} requires item_id")
+        elif self.op == "update" and self.quantity is None:
+            raise ValueError("update requires quantity")
+        return self
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "op": "add",
+                "product_id": 1,
+                "quantity": 2
+            }
+        }
+    )
 
 
 class CartItemRequest(BaseModel):
-    product_id: int = Field(..., example=1, description="Product ID to add")
-    quantity: int = Field(default=1, example=1, ge=1, description="Quantity to add")
+    product_id: int = Field(..., description="Product ID to add")
+    quantity: int = Field(default=1, ge=1, description="Quantity to add")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "product_id": 1,
                 "quantity": 2
             }
         }
+    )
 
 
 class CartResponse(BaseModel):
     items: List[dict] = Field(..., description="List of cart items with product details")
-    total: float = Field(..., example=5998.00, description="Total cart value in USD")
-    item_count: int = Field(..., example=2, description="Total number of items")
+    total: float = Field(..., description="Total cart value in USD")
+    item_count: int = Field(..., description="Total number of items")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "items": [
+                    {
+                        "id": "9f86d081884c7d65",
+                        "product_id": 1,
+                        "name": "Diamond Engagement Ring",
+                        "price": 2999.00,
+                        "quantity": 2
+                    }
+                ],
+                "total": 5998.00,
+                "item_count": 2
+            }
+        }
+    )
 
 
 # In-memory storage (in production, use a database)
@@ -210,39 +324,248 @@ products_db = [
         "in_stock": True,
     },
 ]
+# Read-only from here on: the serialized responses below are derived from it
+# once, so a mutation would silently go stale
+products_db = tuple(MappingProxyType(product) for product in products_db)
+
+
+# Catalog indexes and the inventory total, built in one pass at import so
+# lookups and stats never scan products_db
+_products_by_id = {}
+_products_by_category = {}
+_total_value = 0.0
+for _product in products_db:
+    _products_by_id[_product["id"]] = _product
+    _products_by_category.setdefault(_product["category"], []).append(_product)
+    _total_value += _product["price"]
+
+# One validator for every catalog-derived payload; it changes only when the
+# catalog does. /api/stats is excluded because last_updated ticks every second.
+# It is weak because GZipMiddleware serves gzip and identity bodies under it.
+_products_json = orjson.dumps(products_db, default=dict)
+_catalog_etag_tag = '"' + hashlib.sha1(_products_json).hexdigest()[:16] + '"'
+_catalog_etag = "W/" + _catalog_etag_tag
+_catalog_headers = {"ETag": _catalog_etag, "Cache-Control": "public, max-age=60"}
+
+
+def catalog_entry(body: bytes) -> tuple:
+    """Pair a pre-serialized catalog payload with its complete headers"""
+    headers = {
+        **_catalog_headers,
+        "content-length": str(len(body)),
+        "content-type": "application/json",
+    }
+    return body, headers
+
+
+# Pre-serialized catalog responses. products_db is static, so the hot GET
+# endpoints return these bytes directly instead of re-validating and
+# re-encoding the same dicts on every request.
+_products_entry = catalog_entry(_products_json)
+_products_by_category_entries = {
+    category: catalog_entry(orjson.dumps(products, default=dict))
+    for category, products in _products_by_category.items()
+}
+_no_products_entry = catalog_entry(b"[]")
+_product_entries_by_id = {
+    product_id: catalog_entry(orjson.dumps(product, default=dict))
+    for product_id, product in _products_by_id.items()
+}
+
+# Categories and stats are pure functions of the static catalog
+_categories = sorted(_products_by_category)
+_categories_entry = catalog_entry(orjson.dumps({"categories": _categories}))
+_stats_static = {
+    "total_products": len(products_db),
+    "total_categories": len(_categories),
+    "categories": _categories,
+    "total_inventory_value": round(_total_value, 2),
+    "average_price": (
+        round(_total_value / len(products_db), 2) if products_db else 0
+    ),
+    "status": "active",
+}
+
+
+def timestamped_prefix(payload: dict, field: str) -> bytes:
+    """Serialize payload, leaving it open for a trailing timestamp field"""
+    return orjson.dumps(payload)[:-1] + b',"' + field.encode() + b'":"'
+
+
+# Only last_updated changes per request; it is spliced onto this prefix
+_stats_json_prefix = timestamped_prefix(_stats_static, "last_updated")
+
+# Root and probe bodies are constant apart from the timestamp
+_root_json = orjson.dumps(
+    {
+        "message": "Welcome to Luxe Jewelry Store API",
+        "version": "1.1.0",
+        "feature": "api-improvements",
+    }
+)
+_health_json_prefix = timestamped_prefix(
+    {
+        "status": "healthy",
+        "service": "backend",
+        "version": "1.1.0",
+        "uptime": "running",
+        "database": "connected",
+        "environment": "production",
+    },
+    "timestamp",
+)
+_ready_json_prefix = timestamped_prefix(
+    {"status": "ready", "service": "backend"}, "timestamp"
+)
+
+
+_iso_cache = {"second": 0, "iso": ""}
+
+
+def iso_now() -> str:
+    """Current local time as ISO 8601, rebuilt at most once per second"""
+    second = int(time.time())
+    if second != _iso_cache["second"]:
+        _iso_cache.update(
+            second=second, iso=datetime.fromtimestamp(second).isoformat()
+        )
+    return _iso_cache["iso"]
+
+
+# Fixed cart acknowledgements, serialized once
+_item_removed_json = orjson.dumps({"message": "Item removed from cart"})
+_item_updated_json = orjson.dumps({"message": "Item quantity updated"})
+_cart_cleared_json = orjson.dumps({"message": "Cart cleared"})
+
+
+def json_bytes_response(content: bytes) -> Response:
+    """Wrap pre-serialized JSON; bypasses response_model validation"""
+    return Response(content=content, media_type="application/json")
+
+
+def stamped_json_response(prefix: bytes) -> Response:
+    """Close a timestamped_prefix() payload with the current time"""
+    return json_bytes_response(prefix + iso_now().encode() + b'"}')
+
+
+def catalog_response(request: Request, entry: tuple) -> Response:
+    """Serve a cached catalog payload, or 304 if the client already has it"""
+    if_none_match = request.headers.get("if-none-match")
+    # If-None-Match uses weak comparison, so match with or without the W/ prefix
+    if if_none_match and (
+        if_none_match == "*" or _catalog_etag_tag in if_none_match
+    ):
+        return Response(status_code=304, headers=_catalog_headers)
+    # With content-length and content-type supplied, Starlette only encodes
+    # the headers instead of deriving them
+    body, headers = entry
+    return Response(content=body, headers=headers)
 
 
 # Authentication utilities
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _decode_jwt(token: str) -> dict:
+    """Verify an HS256 JWT from the auth service and return its payload
+
+    Raises the matching jwt.PyJWTError subclass on failure, like jwt.decode.
+    """
+    try:
+        header_segment, payload_segment, signature_segment = token.encode(
+            "ascii"
+        ).split(b".")
+        header = orjson.loads(_b64url_decode(header_segment))
+        signature = _b64url_decode(signature_segment)
+    except (ValueError, binascii.Error):
+        raise jwt.DecodeError("Invalid token")
+    if not isinstance(header, dict) or header.get("alg") != ALGORITHM:
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+    h = _hmac_prototype.copy()
+    h.update(header_segment + b"." + payload_segment)
+    if not hmac.compare_digest(h.digest(), signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    try:
+        payload = orjson.loads(_b64url_decode(payload_segment))
+    except (ValueError, binascii.Error):
+        raise jwt.DecodeError("Invalid payload")
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload")
+
+    # The auth service always sets exp, so a token without one is rejected
+    exp = payload.get("exp")
+    if exp is None:
+        raise jwt.MissingRequiredClaimError("exp")
+    if not isinstance(exp, (int, float)):
+        raise jwt.DecodeError("Expiration Time claim (exp) must be a number")
+    if exp <= time.time():
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
+
+
 async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)):
     """Verify JWT token and return user ID (optional authentication)"""
     if not credentials:
         return None
 
+    token = credentials.credentials
+    payload = _token_cache.get(token)
+    if payload is None or payload["exp"] <= time.time():
+        try:
+            payload = _decode_jwt(token)
+        except jwt.PyJWTError:
+            return None
+        _token_cache[token] = payload
+
+    user_id: str = payload.get("sub")
+    return user_id
+
+
+async def fetch_user_info(token: str) -> Optional[dict]:
+    """Look up the token's user on the auth service; None if unavailable"""
     try:
-        payload = jwt.decode(
-            credentials.credentials, JWT_SECRET_KEY, algorithms=[ALGORITHM]
-        )
-        user_id: str = payload.get("sub")
-        return user_id
-    except jwt.PyJWTError:
-        return None
+        # Forward the caller's own token rather than signing a new one
+        headers = {"Authorization": f"Bearer {token}"}
+        response = await app.state.auth_client.get("/auth/me", headers=headers)
+        if response.status_code == 200:
+            return response.json()
+    except Exception:
+        pass
+    return None
 
 
-async def get_current_user(user_id: str = Depends(verify_token)):
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    user_id: str = Depends(verify_token),
+):
     """Get current user info from auth service"""
     if not user_id:
         return None
 
-    try:
-        async with httpx.AsyncClient() as client:
-            headers = {
-                "Authorization": f"Bearer {jwt.encode({'sub': user_id}, JWT_SECRET_KEY, algorithm=ALGORITHM)}"
-            }
-            response = await client.get(f"{AUTH_SERVICE_URL}/auth/me", headers=headers)
-            if response.status_code == 200:
-                return response.json()
-    except Exception:
-        pass
+    user_info = _user_info_cache.get(user_id)
+    if user_info is not None:
+        return user_info
+
+    # Concurrent misses for the same user share one auth-service call. It runs
+    # as its own task so a cancelled caller can't cut it short for the others.
+    lookup = _user_info_inflight.get(user_id)
+    if lookup is None:
+        lookup = asyncio.ensure_future(fetch_user_info(credentials.credentials))
+        _user_info_inflight[user_id] = lookup
+        lookup.add_done_callback(
+            lambda task: _finish_user_info_lookup(user_id, task)
+        )
+    return await asyncio.shield(lookup)
+
+
+def _finish_user_info_lookup(user_id: str, task: asyncio.Task) -> None:
+    """Cache a completed auth-service lookup and retire it from the in-flight map"""
+    del _user_info_inflight[user_id]
+    if not task.cancelled() and task.result() is not None:
+        _user_info_cache[user_id] = task.result()
 
 
 # In-memory cart storage (in production, use database with user sessions)
@@ -250,6 +573,34 @@ carts_db = {}
 # User-based carts (for authenticated users)
 user_carts_db = {}
 
+
+def new_cart() -> dict:
+    """Empty cart: items keyed by cart item id plus a product_id -> item id index"""
+    return {"items": {}, "by_product": {}}
+
+
+def remove_cart_item(cart: dict, item_id: str) -> None:
+    """Remove an item from a cart and its product index entry"""
+    item = cart["items"].pop(item_id)
+    del cart["by_product"][item["product_id"]]
+
+
+def add_cart_item(cart: dict, product_id: int, quantity: int) -> None:
+    """Add a product to a cart, merging into its existing item if present"""
+    existing_id = cart["by_product"].get(product_id)
+    if existing_id is not None:
+        cart["items"][existing_id]["quantity"] += quantity
+    else:
+        cart_item = {
+            "id": secrets.token_hex(8),
+            "product_id": product_id,
+            "quantity": quantity,
+            "added_at": iso_now(),
+        }
+        cart["items"][cart_item["id"]] = cart_item
+        cart["by_product"][product_id] = cart_item["id"]
+
+
 # API Endpoints
 
 
@@ -263,11 +614,7 @@ async def root():
     """
     Root endpoint returning API welcome message and version info.
     """
-    return {
-        "message": "Welcome to Luxe Jewelry Store API",
-        "version": "1.1.0",
-        "feature": "api-improvements",
-    }
+    return json_bytes_response(_root_json)
 
 
 @app.get(
@@ -296,15 +643,7 @@ async def root():
 )
 async def health_check():
     """Health check endpoint for monitoring and CI/CD."""
-    return {
-        "status": "healthy",
-        "service": "backend",
-        "version": "1.1.0",
-        "timestamp": datetime.now().isoformat(),
-        "uptime": "running",
-        "database": "connected",
-        "environment": "production",
-    }
+    return stamped_json_response(_health_json_prefix)
 
 
 @app.get(
@@ -334,11 +673,7 @@ async def readiness_check():
     """
     # Add any initialization checks here (database, cache, etc.)
     # For now, if the app is running, it's ready
-    return {
-        "status": "ready",
-        "service": "backend",
-        "timestamp": datetime.now().isoformat(),
-    }
+    return stamped_json_response(_ready_json_prefix)
 
 
 @app.get(
@@ -369,6 +704,7 @@ async def readiness_check():
     }
 )
 async def get_products(
+    request: Request,
     category: Optional[str] = Query(
         None,
         description="Filter products by category",
@@ -382,9 +718,10 @@ async def get_products(
     - **category**: Optional filter for product category (rings, necklaces, bracelets, earrings)
     """
     if category:
-        filtered_products = [p for p in products_db if p["category"] == category]
-        return filtered_products
-    return products_db
+        return catalog_response(
+            request, _products_by_category_entries.get(category, _no_products_entry)
+        )
+    return catalog_response(request, _products_entry)
 
 
 @app.get(
@@ -406,6 +743,7 @@ async def get_products(
     }
 )
 async def get_product(
+    request: Request,
     product_id: int = Path(..., description="Unique product identifier", example=1, ge=1)
 ):
     """
@@ -413,10 +751,10 @@ async def get_product(
     
     - **product_id**: The unique identifier of the product
     """
-    product = next((p for p in products_db if p["id"] == product_id), None)
-    if not product:
+    product_entry = _product_entries_by_id.get(product_id)
+    if product_entry is None:
         raise HTTPException(status_code=404, detail="Product not found")
-    return product
+    return catalog_response(request, product_entry)
 
 
 @app.post(
@@ -458,7 +796,7 @@ async def add_to_cart(
     Anonymous users use session-based carts.
     """
     # Find the product
-    product = next((p for p in products_db if p["id"] == item.product_id), None)
+    product = _products_by_id.get(item.product_id)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
 
@@ -466,33 +804,18 @@ async def add_to_cart(
     if current_user:
         user_id = current_user["id"]
         if user_id not in user_carts_db:
-            user_carts_db[user_id] = []
+            user_carts_db[user_id] = new_cart()
         cart = user_carts_db[user_id]
     else:
         if session_id not in carts_db:
-            carts_db[session_id] = []
+            carts_db[session_id] = new_cart()
         cart = carts_db[session_id]
 
-    # Check if item already exists in cart
-    existing_item = next(
-        (cart_item for cart_item in cart if cart_item["product_id"] == item.product_id),
-        None,
-    )
+    add_cart_item(cart, item.product_id, item.quantity)
 
-    if existing_item:
-        # Update quantity if item exists
-        existing_item["quantity"] += item.quantity
-    else:
-        # Add new item to cart
-        cart_item = {
-            "id": str(uuid.uuid4()),
-            "product_id": item.product_id,
-            "quantity": item.quantity,
-            "added_at": datetime.now().isoformat(),
-        }
-        cart.append(cart_item)
-
-    return {"message": "Item added to cart", "cart_items": len(cart)}
+    return ORJSONResponse(
+        {"message": "Item added to cart", "cart_items": len(cart["items"])}
+    )
 
 
 @app.get(
@@ -508,7 +831,7 @@ async def add_to_cart(
                 "application/json": {
                     "example": [
                         {
-                            "id": "550e8400-e29b-41d4-a716-446655440000",
+                            "id": "9f86d081884c7d65",
                             "product_id": 1,
                             "quantity": 2,
                             "added_at": "2024-01-15T10:30:00"
@@ -532,11 +855,13 @@ async def get_cart(
     """
     if current_user:
         # Return user's cart if authenticated
-        user_id = current_user["id"]
-        return user_carts_db.get(user_id, [])
+        cart = user_carts_db.get(current_user["id"])
     else:
         # Return session-based cart for anonymous users
-        return carts_db.get(session_id, [])
+        cart = carts_db.get(session_id)
+
+    # Cart items are built server-side, so skip response_model validation
+    return ORJSONResponse(list(cart["items"].values()) if cart else [])
 
 
 @app.delete(
@@ -565,14 +890,14 @@ async def get_cart(
 )
 async def remove_from_cart(
     session_id: str = Path(..., description="Session ID", example="sess-abc123"),
-    item_id: str = Path(..., description="Cart item UUID to remove", example="550e8400-e29b-41d4-a716-446655440000"),
+    item_id: str = Path(..., description="Cart item ID to remove", example="9f86d081884c7d65"),
     current_user: dict = Depends(get_current_user)
 ):
     """
     Remove an item from the shopping cart.
     
     - **session_id**: Session identifier for anonymous users
-    - **item_id**: UUID of the cart item to remove
+    - **item_id**: ID of the cart item to remove
     """
     # Determine which cart to use
     if current_user:
@@ -586,14 +911,14 @@ async def remove_from_cart(
         cart = carts_db[session_id]
 
     # Find and remove the item
-    item_to_remove = next((item for item in cart if item["id"] == item_id), None)
-
-    if not item_to_remove:
+    if item_id not in cart["items"]:
         raise HTTPException(status_code=404, detail="Item not found in cart")
 
-    cart.remove(item_to_remove)
+    remove_cart_item(cart, item_id)
 
-    return {"message": "Item removed from cart", "cart_items": len(cart)}
+    return ORJSONResponse(
+        {"message": "Item removed from cart", "cart_items": len(cart["items"])}
+    )
 
 
 @app.put(
@@ -622,7 +947,7 @@ async def remove_from_cart(
 )
 async def update_cart_item(
     session_id: str = Path(..., description="Session ID", example="sess-abc123"),
-    item_id: str = Path(..., description="Cart item UUID", example="550e8400-e29b-41d4-a716-446655440000"),
+    item_id: str = Path(..., description="Cart item ID", example="9f86d081884c7d65"),
     quantity: int = Query(..., description="New quantity (0 to remove)", example=3, ge=0),
     current_user: dict = Depends(get_current_user),
 ):
@@ -630,7 +955,7 @@ async def update_cart_item(
     Update the quantity of an item in the cart.
     
     - **session_id**: Session identifier for anonymous users
-    - **item_id**: UUID of the cart item to update
+    - **item_id**: ID of the cart item to update
     - **quantity**: New quantity (set to 0 to remove the item)
     """
     # Determine which cart to use
@@ -645,18 +970,92 @@ async def update_cart_item(
         cart = carts_db[session_id]
 
     # Find the item
-    item = next((item for item in cart if item["id"] == item_id), None)
+    item = cart["items"].get(item_id)
 
     if not item:
         raise HTTPException(status_code=404, detail="Item not found in cart")
 
     if quantity <= 0:
         # Remove item if quantity is 0 or negative
-        cart.remove(item)
-        return {"message": "Item removed from cart"}
+        remove_cart_item(cart, item_id)
+        return json_bytes_response(_item_removed_json)
     else:
         item["quantity"] = quantity
-        return {"message": "Item quantity updated"}
+        return json_bytes_response(_item_updated_json)
+
+
+@app.post(
+    "/api/cart/{session_id}/batch",
+    tags=["Cart"],
+    summary="Apply Cart Operations",
+    response_description="Confirmation of the updated cart",
+    responses={
+        200: {
+            "description": "All operations applied",
+            "content": {
+                "application/json": {
+                    "example": {"message": "Cart updated", "cart_items": 2}
+                }
+            }
+        },
+        404: {
+            "description": "Product or item not found; the cart is left unchanged",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Item not found in cart"}
+                }
+            }
+        }
+    }
+)
+async def batch_cart_operations(
+    session_id: str = Path(..., description="Session ID for anonymous users", example="sess-abc123"),
+    operations: List[CartOperation] = Body(..., min_length=1, max_length=50),
+    current_user: dict = Depends(get_current_user),
+):
+    """
+    Apply several cart changes in one request.
+    
+    - **session_id**: Session identifier for anonymous users (ignored for authenticated users)
+    - **operations**: Adds, removes and quantity updates, applied in order
+    
+    The batch is all-or-nothing: if any operation fails, the cart is unchanged.
+    """
+    # Determine which cart to use
+    if current_user:
+        carts, cart_key = user_carts_db, current_user["id"]
+    else:
+        carts, cart_key = carts_db, session_id
+    cart = carts.get(cart_key)
+
+    # Work on a copy so a failing operation leaves the stored cart untouched
+    if cart is None:
+        working = new_cart()
+    else:
+        working = {
+            "items": {item_id: dict(item) for item_id, item in cart["items"].items()},
+            "by_product": dict(cart["by_product"]),
+        }
+
+    for operation in operations:
+        if operation.op == "add":
+            if operation.product_id not in _products_by_id:
+                raise HTTPException(status_code=404, detail="Product not found")
+            add_cart_item(working, operation.product_id, operation.quantity)
+            continue
+
+        item = working["items"].get(operation.item_id)
+        if not item:
+            raise HTTPException(status_code=404, detail="Item not found in cart")
+        if operation.op == "remove" or operation.quantity <= 0:
+            remove_cart_item(working, operation.item_id)
+        else:
+            item["quantity"] = operation.quantity
+
+    carts[cart_key] = working
+    return ORJSONResponse(
+        {"message": "Cart updated", "cart_items": len(working["items"])}
+    )
 
 
 @app.delete(
@@ -688,11 +1087,11 @@ async def clear_cart(
     if current_user:
         user_id = current_user["id"]
         if user_id in user_carts_db:
-            user_carts_db[user_id] = []
+            user_carts_db[user_id] = new_cart()
     else:
         if session_id in carts_db:
-            carts_db[session_id] = []
-    return {"message": "Cart cleared"}
+            carts_db[session_id] = new_cart()
+    return json_bytes_response(_cart_cleared_json)
 
 
 @app.get(
@@ -711,14 +1110,13 @@ async def clear_cart(
         }
     }
 )
-async def get_categories():
+async def get_categories(request: Request):
     """
     Get all available product categories.
     
     Returns a list of unique categories from the product catalog.
     """
-    categories = list(set(p["category"] for p in products_db))
-    return {"categories": categories}
+    return catalog_response(request, _categories_entry)
 
 
 @app.get(
@@ -755,24 +1153,21 @@ async def get_stats():
     - Inventory value
     - Average product price
     """
-    total_products = len(products_db)
-    categories = list(set(p["category"] for p in products_db))
-    total_value = sum(p["price"] for p in products_db)
-
-    return {
-        "total_products": total_products,
-        "total_categories": len(categories),
-        "categories": categories,
-        "total_inventory_value": round(total_value, 2),
-        "average_price": (
-            round(total_value / total_products, 2) if total_products > 0 else 0
-        ),
-        "status": "active",
-        "last_updated": datetime.now().isoformat(),
-    }
+    return stamped_json_response(_stats_json_prefix)
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # A single worker on purpose: carts live in process memory, so every
+    # worker would see different carts. uvloop and httptools come with
+    # uvicorn[standard].
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        limit_concurrency=1000,
+        timeout_keep_alive=30,
+    )
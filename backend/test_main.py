@@ -1,9 +1,83 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import time
+
+import jwt
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
 from fastapi.testclient import TestClient
-from main import app
+from main import (
+    JWT_SECRET_KEY,
+    _token_cache,
+    _user_info_cache,
+    app,
+    get_current_user,
+)
 
 client = TestClient(app)
 
 
+class FakeAuthResponse:
+    def __init__(self, user):
+        self.status_code = 200 if user else 401
+        self._user = user
+
+    def json(self):
+        return self._user
+
+
+class FakeAuthClient:
+    """Stands in for the pooled auth-service client; records forwarded tokens"""
+
+    def __init__(self, user, delay=0):
+        self.user = user
+        self.delay = delay
+        self.tokens = []
+
+    async def get(self, url, headers=None):
+        self.tokens.append(headers["Authorization"])
+        await asyncio.sleep(self.delay)
+        return FakeAuthResponse(self.user)
+
+
+@pytest.fixture
+def auth_service(monkeypatch):
+    """Fake auth service that knows one user; token caches start empty"""
+    _token_cache.clear()
+    _user_info_cache.clear()
+    auth_client = FakeAuthClient({"id": "user-1", "email": "user@example.com"})
+    monkeypatch.setattr(app.state, "auth_client", auth_client, raising=False)
+    yield auth_client
+    _token_cache.clear()
+    _user_info_cache.clear()
+
+
+def make_token(**claims):
+    claims.setdefault("sub", "user-1")
+    claims.setdefault("exp", int(time.time()) + 300)
+    return jwt.encode(claims, JWT_SECRET_KEY, algorithm="HS256")
+
+
+def b64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def unsigned_token(header: bytes, payload: bytes) -> str:
+    """Header and payload segments with an empty signature segment"""
+    return f"{b64url(header)}.{b64url(payload)}."
+
+
+def signed_token(header: bytes, payload: bytes) -> str:
+    """Token with a valid HS256 signature over arbitrary header/payload JSON"""
+    signing_input = unsigned_token(header, payload)
+    signature = hmac.new(
+        JWT_SECRET_KEY.encode(), signing_input[:-1].encode(), hashlib.sha256
+    ).digest()
+    return signing_input + b64url(signature)
+
+
 def test_root_endpoint():
     """Test the root endpoint"""
     response = client.get("/")
@@ -54,6 +128,13 @@ def test_get_products_by_category():
         assert product["category"] == "rings"
 
 
+def test_get_products_unknown_category():
+    """Test filtering by a category with no products"""
+    response = client.get("/api/products?category=watches")
+    assert response.status_code == 200
+    assert response.json() == []
+
+
 def test_get_single_product():
     """Test getting a single product"""
     response = client.get("/api/products/1")
@@ -64,6 +145,33 @@ def test_get_single_product():
     assert "price" in product
 
 
+def test_get_products_etag():
+    """Test conditional GETs on the product catalog"""
+    response = client.get("/api/products")
+    etag = response.headers["etag"]
+    assert "max-age" in response.headers["cache-control"]
+    # Weak, since gzip and identity bodies share it
+    assert etag.startswith('W/"')
+    response = client.get("/api/products", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    response = client.get("/api/products", headers={"If-None-Match": etag[2:]})
+    assert response.status_code == 304
+
+
+@pytest.mark.parametrize(
+    "url", ["/api/products", "/api/products?category=rings", "/api/products/1"]
+)
+def test_catalog_response_headers(url):
+    """Test that prebuilt catalog headers match each payload"""
+    response = client.get(url, headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert response.headers["content-length"] == str(len(response.content))
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["etag"] == client.get("/api/categories").headers["etag"]
+    assert response.headers["cache-control"] == "public, max-age=60"
+
+
 def test_get_nonexistent_product():
     """Test getting a product that doesn't exist"""
     response = client.get("/api/products/999")
@@ -99,3 +207,148 @@ def test_get_stats():
     assert isinstance(data["categories"], list)
     assert data["total_products"] > 0
     assert data["total_categories"] > 0
+
+
+def test_cart_add_update_remove():
+    """Test adding, merging, updating and removing cart items"""
+    session_id = "test-cart-session"
+    response = client.post(
+        f"/api/cart/{session_id}/add", json={"product_id": 1, "quantity": 2}
+    )
+    assert response.status_code == 200
+    assert response.json()["cart_items"] == 1
+    # Adding the same product again merges into the existing item
+    response = client.post(f"/api/cart/{session_id}/add", json={"product_id": 1})
+    assert response.json()["cart_items"] == 1
+
+    cart = client.get(f"/api/cart?session_id={session_id}").json()
+    assert len(cart) == 1
+    assert cart[0]["quantity"] == 3
+    item_id = cart[0]["id"]
+
+    response = client.put(f"/api/cart/{session_id}/item/{item_id}?quantity=5")
+    assert response.status_code == 200
+    cart = client.get(f"/api/cart?session_id={session_id}").json()
+    assert cart[0]["quantity"] == 5
+
+    response = client.delete(f"/api/cart/{session_id}/item/{item_id}")
+    assert response.status_code == 200
+    assert response.json()["cart_items"] == 0
+    response = client.delete(f"/api/cart/{session_id}/item/{item_id}")
+    assert response.status_code == 404
+
+
+def test_cart_batch_operations():
+    """Test applying several cart operations in one request"""
+    session_id = "test-batch-session"
+    response = client.post(
+        f"/api/cart/{session_id}/batch",
+        json=[
+            {"op": "add", "product_id": 1, "quantity": 2},
+            {"op": "add", "product_id": 2},
+        ],
+    )
+    assert response.status_code == 200
+    assert response.json()["cart_items"] == 2
+
+    cart = client.get(f"/api/cart?session_id={session_id}").json()
+    item_id = next(item["id"] for item in cart if item["product_id"] == 1)
+
+    # A failing operation leaves the whole batch unapplied
+    response = client.post(
+        f"/api/cart/{session_id}/batch",
+        json=[
+            {"op": "remove", "item_id": item_id},
+            {"op": "add", "product_id": 999},
+        ],
+    )
+    assert response.status_code == 404
+    assert len(client.get(f"/api/cart?session_id={session_id}").json()) == 2
+
+    response = client.post(
+        f"/api/cart/{session_id}/batch",
+        json=[{"op": "update", "item_id": item_id, "quantity": 0}],
+    )
+    assert response.json()["cart_items"] == 1
+
+    response = client.post(f"/api/cart/{session_id}/batch", json=[{"op": "remove"}])
+    assert response.status_code == 422
+    # An update must say what quantity to set
+    response = client.post(
+        f"/api/cart/{session_id}/batch", json=[{"op": "update", "item_id": item_id}]
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_current_user_lookup_survives_cancelled_caller(auth_service):
+    """Test that cancelling one caller doesn't fail a shared auth lookup"""
+    auth_service.delay = 0.05
+    user = auth_service.user
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials="tok")
+
+    first = asyncio.ensure_future(get_current_user(credentials, user["id"]))
+    second = asyncio.ensure_future(get_current_user(credentials, user["id"]))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    assert await second == user
+    assert len(auth_service.tokens) == 1
+
+
+def test_valid_token_uses_user_cart(auth_service):
+    """Test that an authenticated add goes to the user's cart"""
+    headers = {"Authorization": f"Bearer {make_token()}"}
+    response = client.post(
+        "/api/cart/jwt-valid/add", json={"product_id": 1}, headers=headers
+    )
+    assert response.status_code == 200
+    assert len(client.get("/api/cart", headers=headers).json()) == 1
+    assert client.get("/api/cart?session_id=jwt-valid").json() == []
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        # Another user's claims under a signature taken from a real token
+        unsigned_token(b'{"alg": "HS256"}', b'{"sub": "user-2"}')
+        + make_token().rsplit(".", 1)[1],
+        unsigned_token(b'{"alg": "none"}', b'{"sub": "user-1"}'),
+        make_token(exp=int(time.time()) - 10),
+        "not-a-jwt",
+        "a.b.c",
+        signed_token(b"[]", b'{"sub": "user-1"}'),
+        signed_token(b'{"alg": "HS256"}', b'["user-1"]'),
+        signed_token(b'{"alg": "HS256"}', b'{"sub": "user-1"}'),
+    ],
+    ids=[
+        "tampered",
+        "alg-none",
+        "expired",
+        "malformed",
+        "bad-base64",
+        "list-header",
+        "list-payload",
+        "no-exp",
+    ],
+)
+def test_invalid_token_falls_back_to_anonymous(auth_service, token):
+    """Test that a rejected token is treated as an anonymous session"""
+    session_id = "jwt-rejected"
+    client.delete(f"/api/cart/{session_id}")
+    headers = {"Authorization": f"Bearer {token}"}
+    response = client.post(
+        f"/api/cart/{session_id}/add", json={"product_id": 1}, headers=headers
+    )
+    assert response.status_code == 200
+    assert len(client.get(f"/api/cart?session_id={session_id}").json()) == 1
+    assert auth_service.tokens == []
+
+
+def test_user_lookup_forwards_token_and_is_cached(auth_service):
+    """Test that the caller's token is forwarded once, then served from cache"""
+    token = make_token()
+    headers = {"Authorization": f"Bearer {token}"}
+    for _ in range(3):
+        assert client.get("/api/cart", headers=headers).status_code == 200
+    assert auth_service.tokens == [f"Bearer {token}"]